@@ -3,13 +3,19 @@
 Create all font system components with proper structure.
 """
 import os
+import re
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Project root
 PROJECT_ROOT = Path("/home/user/Corten-FontSystem")
 PROJECT_VERSION = "0.1.0"
 
+# Matches {{PLACEHOLDER}} markers in the CLAUDE.md template
+_PLACEHOLDER_RE = re.compile(rb"\{\{([A-Z_]+)\}\}")
+
 # Component definitions
 COMPONENTS = [
     {
@@ -70,32 +76,51 @@ COMPONENTS = [
     }
 ]
 
-def create_component_dirs(component_name):
-    """Create component directory structure."""
-    base_path = PROJECT_ROOT / "components" / component_name
-
-    dirs = [
-        base_path / "src",
-        base_path / "tests" / "unit",
-        base_path / "tests" / "integration",
-        base_path / "tests" / "contracts",
-        base_path / "benches"
-    ]
-
-    for dir_path in dirs:
-        dir_path.mkdir(parents=True, exist_ok=True)
-
-    return base_path
-
-def create_cargo_toml(component_path, component):
-    """Create Cargo.toml for Rust component."""
-    cargo_toml = f"""[package]
-name = "{component['name']}"
+# Relevant specification sections per component
+_SPEC_SECTIONS = {
+    "font_types": "- Core Types (lines 91-235)\n- Public API Specification (lines 237-295)",
+    "font_parser": "- Phase 2: Font Parser Implementation (lines 387-438)\n- OpenType Parser (lines 390-438)",
+    "font_registry": "- Font Registry (lines 42-46)\n- Font Matching (lines 47)",
+    "text_shaper": "- Phase 3: Text Shaping Engine (lines 440-505)\n- Harfbuzz Integration (lines 357-385)",
+    "glyph_renderer": "- Phase 4: Rasterization Engine (lines 507-580)",
+    "platform_integration": "- Phase 5: Platform Integration (lines 582-628)",
+    "font_system_api": "- Main API Interface (lines 238-295)\n- Browser Integration Interface (lines 297-354)"
+}
+
+def _write_bytes(path, data):
+    """Write already-encoded data to path with raw os.write calls."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _write_if_changed(path, data):
+    """Write data to path unless the file already holds exactly these bytes.
+
+    Returns True if the file was written, False if it was left unchanged.
+    """
+    try:
+        existing = path.read_bytes()
+    except FileNotFoundError:
+        existing = None
+
+    if existing == data:
+        return False
+
+    _write_bytes(path, data)
+    return True
+
+# Generated file templates
+_CARGO_TMPL = """[package]
+name = "{name}"
 version = "0.1.0"
 edition = "2021"
 authors = ["CortenBrowser Team"]
 license = "MIT OR Apache-2.0"
-description = "{component['responsibility']}"
+description = "{responsibility}"
 
 [dependencies]
 # Add dependencies based on component needs
@@ -106,7 +131,7 @@ proptest = "1.4"
 test-case = "3.1"
 
 [lib]
-name = "{component['name']}"
+name = "{name}"
 path = "src/lib.rs"
 
 [[bench]]
@@ -114,12 +139,7 @@ name = "benchmarks"
 harness = false
 """
 
-    with open(component_path / "Cargo.toml", "w") as f:
-        f.write(cargo_toml)
-
-def create_lib_rs(component_path, component):
-    """Create src/lib.rs stub."""
-    lib_rs = f"""//! {component['name']} - {component['responsibility']}
+_LIB_TMPL = """//! {name} - {responsibility}
 
 #![warn(missing_docs)]
 #![warn(clippy::all)]
@@ -139,29 +159,20 @@ mod tests {{
 }}
 """
 
-    with open(component_path / "src" / "lib.rs", "w") as f:
-        f.write(lib_rs)
-
-    # Create types.rs stub
-    types_rs = f"""//! Common types for {component['name']}
+_TYPES_TMPL = """//! Common types for {name}
 
 // Type definitions will be added during implementation
 """
 
-    with open(component_path / "src" / "types.rs", "w") as f:
-        f.write(types_rs)
+_README_TMPL = """# {name}
 
-def create_readme(component_path, component):
-    """Create README.md."""
-    readme = f"""# {component['name']}
-
-**Type**: {component['type']}
-**Tech Stack**: {component['tech_stack']}
-**Version**: {PROJECT_VERSION}
+**Type**: {type}
+**Tech Stack**: {tech_stack}
+**Version**: {version}
 
 ## Responsibility
 
-{component['responsibility']}
+{responsibility}
 
 ## Structure
 
@@ -176,7 +187,7 @@ def create_readme(component_path, component):
 
 ## Dependencies
 
-{chr(10).join(f"- {dep}" for dep in component['dependencies']) if component['dependencies'] else "None (base component)"}
+{deps_block}
 
 ## Usage
 
@@ -210,57 +221,176 @@ cargo fmt
 Implementation details will be added during development following the specifications in `/home/user/Corten-FontSystem/font-system-specification.md`.
 """
 
-    with open(component_path / "README.md", "w") as f:
-        f.write(readme)
+# component.yaml layout (keys sorted like yaml.safe_dump). String scalars are
+# substituted as JSON strings, which are valid YAML double-quoted scalars.
+_YAML_TMPL = """dependencies:
+  imports:{imports}
+estimated_tokens: {estimated_tokens}
+exports:
+  module: {module}
+  public_api: []
+language: rust
+name: {name}
+responsibility: {responsibility}
+tech_stack: {tech_stack}
+type: {type}
+version: {version}
+"""
+
+_YAML_IMPORT_TMPL = """  - import_from: {module}
+    name: {dep}
+    version: ^0.1.0"""
+
+# Directories already created (or found existing) during this run
+_created_dirs = set()
+
+def _make_dirs(dir_path):
+    """Create dir_path and any missing parents, skipping ones already seen.
+
+    Returns True if any directory was created, False if all already existed.
+    """
+    missing = []
+    path = str(dir_path)
+    while path not in _created_dirs:
+        if os.path.isdir(path):
+            _created_dirs.add(path)
+            break
+        missing.append(path)
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+
+    created = False
+    for path in reversed(missing):
+        try:
+            os.mkdir(path)
+            created = True
+        except FileExistsError:
+            if not os.path.isdir(path):
+                raise
+        _created_dirs.add(path)
+
+    return created
+
+def create_component_dirs(component_name):
+    """Create component directory structure.
+
+    Returns the component path and whether any directory was created.
+    """
+    base_path = PROJECT_ROOT / "components" / component_name
+
+    dirs = [
+        base_path / "src",
+        base_path / "tests" / "unit",
+        base_path / "tests" / "integration",
+        base_path / "tests" / "contracts",
+        base_path / "benches"
+    ]
+
+    created = False
+    for dir_path in dirs:
+        created = _make_dirs(dir_path) or created
+
+    return base_path, created
+
+def create_cargo_toml(component_path, component):
+    """Create Cargo.toml for Rust component."""
+    cargo_toml = _CARGO_TMPL.format(
+        name=component['name'],
+        responsibility=component['responsibility'],
+    )
+
+    return _write_if_changed(component_path / "Cargo.toml", cargo_toml.encode("utf-8"))
+
+def create_lib_rs(component_path, component):
+    """Create src/lib.rs and src/types.rs stubs.
+
+    Returns whether lib.rs and types.rs were written, in that order.
+    """
+    lib_rs = _LIB_TMPL.format(
+        name=component['name'],
+        responsibility=component['responsibility'],
+    )
+
+    lib_written = _write_if_changed(component_path / "src" / "lib.rs", lib_rs.encode("utf-8"))
+
+    # Create types.rs stub
+    types_rs = _TYPES_TMPL.format(name=component['name'])
+
+    types_written = _write_if_changed(component_path / "src" / "types.rs", types_rs.encode("utf-8"))
+
+    return lib_written, types_written
+
+def create_readme(component_path, component):
+    """Create README.md."""
+    if component['dependencies']:
+        deps_block = "\n".join(f"- {dep}" for dep in component['dependencies'])
+    else:
+        deps_block = "None (base component)"
+
+    readme = _README_TMPL.format(
+        name=component['name'],
+        type=component['type'],
+        tech_stack=component['tech_stack'],
+        version=PROJECT_VERSION,
+        responsibility=component['responsibility'],
+        deps_block=deps_block,
+    )
+
+    return _write_if_changed(component_path / "README.md", readme.encode("utf-8"))
 
 def create_component_yaml(component_path, component):
     """Create component.yaml manifest."""
-    manifest = {
-        "name": component['name'],
-        "version": PROJECT_VERSION,
-        "type": component['type'],
-        "language": "rust",
-        "tech_stack": component['tech_stack'],
-        "responsibility": component['responsibility'],
-        "estimated_tokens": component['estimated_tokens'],
-        "dependencies": {
-            "imports": [
-                {
-                    "name": dep,
-                    "version": "^0.1.0",
-                    "import_from": f"components.{dep}"
-                }
-                for dep in component['dependencies']
-            ]
-        },
-        "exports": {
-            "module": f"components.{component['name']}",
-            "public_api": []
-        }
-    }
+    if component['dependencies']:
+        imports = "\n" + "\n".join(
+            _YAML_IMPORT_TMPL.format(
+                module=json.dumps(f"components.{dep}"),
+                dep=json.dumps(dep),
+            )
+            for dep in component['dependencies']
+        )
+    else:
+        imports = " []"
+
+    manifest = _YAML_TMPL.format(
+        imports=imports,
+        estimated_tokens=component['estimated_tokens'],
+        module=json.dumps(f"components.{component['name']}"),
+        name=json.dumps(component['name']),
+        responsibility=json.dumps(component['responsibility']),
+        tech_stack=json.dumps(component['tech_stack']),
+        type=json.dumps(component['type']),
+        version=json.dumps(PROJECT_VERSION),
+    )
+
+    return _write_if_changed(component_path / "component.yaml", manifest.encode("utf-8"))
+
+@lru_cache(maxsize=1)
+def _load_template():
+    """Read the generic component CLAUDE.md template as bytes (cached after first read)."""
+    template_path = PROJECT_ROOT / "claude-orchestration-system" / "templates" / "component-generic.md"
 
-    with open(component_path / "component.yaml", "w") as f:
-        import yaml
-        yaml.safe_dump(manifest, f, default_flow_style=False)
+    with open(template_path, "rb") as f:
+        # Normalise line endings as text mode's universal newlines would
+        return f.read().replace(b"\r\n", b"\n").replace(b"\r", b"\n")
 
 def create_claude_md(component_path, component):
     """Create CLAUDE.md from template."""
-    template_path = PROJECT_ROOT / "claude-orchestration-system" / "templates" / "component-generic.md"
-
-    with open(template_path, "r") as f:
-        template = f.read()
-
-    # Perform substitutions
-    claude_md = template.replace("{{COMPONENT_NAME}}", component['name'])
-    claude_md = claude_md.replace("{{TECH_STACK}}", component['tech_stack'])
-    claude_md = claude_md.replace("{{CURRENT_TOKENS}}", "0")
-    claude_md = claude_md.replace("{{COMPONENT_RESPONSIBILITY}}", component['responsibility'])
-    claude_md = claude_md.replace("{{PROJECT_VERSION}}", PROJECT_VERSION)
-    claude_md = claude_md.replace("{{STYLE_GUIDE}}", "Rust Style Guide")
-    claude_md = claude_md.replace("{{FORMATTER}}", "cargo fmt")
-    claude_md = claude_md.replace("{{LINTER}}", "cargo clippy")
-    claude_md = claude_md.replace("{{LINT_COMMAND}}", "cargo clippy")
-    claude_md = claude_md.replace("{{ADDITIONAL_INSTRUCTIONS}}", f"""
+    template = _load_template()
+
+    # Perform substitutions in a single pass
+    subs = {
+        b"COMPONENT_NAME": component['name'],
+        b"TECH_STACK": component['tech_stack'],
+        b"CURRENT_TOKENS": "0",
+        b"COMPONENT_RESPONSIBILITY": component['responsibility'],
+        b"PROJECT_VERSION": PROJECT_VERSION,
+        b"STYLE_GUIDE": "Rust Style Guide",
+        b"FORMATTER": "cargo fmt",
+        b"LINTER": "cargo clippy",
+        b"LINT_COMMAND": "cargo clippy",
+        b"ADDITIONAL_INSTRUCTIONS": f"""
 ## Rust-Specific Instructions
 
 ### Code Organization
@@ -295,53 +425,54 @@ Full specification: `/home/user/Corten-FontSystem/font-system-specification.md`
 
 Component sections:
 {_get_spec_sections(component['name'])}
-""")
+""",
+    }
+    encoded = {key: value.encode("utf-8") for key, value in subs.items()}
+    claude_md = _PLACEHOLDER_RE.sub(lambda m: encoded.get(m.group(1), m.group(0)), template)
 
-    with open(component_path / "CLAUDE.md", "w") as f:
-        f.write(claude_md)
+    return _write_if_changed(component_path / "CLAUDE.md", claude_md)
 
 def _get_spec_sections(component_name):
     """Get relevant specification sections for component."""
-    sections = {
-        "font_types": "- Core Types (lines 91-235)\n- Public API Specification (lines 237-295)",
-        "font_parser": "- Phase 2: Font Parser Implementation (lines 387-438)\n- OpenType Parser (lines 390-438)",
-        "font_registry": "- Font Registry (lines 42-46)\n- Font Matching (lines 47)",
-        "text_shaper": "- Phase 3: Text Shaping Engine (lines 440-505)\n- Harfbuzz Integration (lines 357-385)",
-        "glyph_renderer": "- Phase 4: Rasterization Engine (lines 507-580)",
-        "platform_integration": "- Phase 5: Platform Integration (lines 582-628)",
-        "font_system_api": "- Main API Interface (lines 238-295)\n- Browser Integration Interface (lines 297-354)"
-    }
-    return sections.get(component_name, "- See full specification")
+    return _SPEC_SECTIONS.get(component_name, "- See full specification")
 
-def main():
-    """Create all components."""
-    print("Creating Font System components...")
+def _file_status(label, written):
+    """Format the progress line for a generated file."""
+    if written:
+        return f"  ✓ Created {label}"
+    return f"  - {label} unchanged"
 
-    for component in COMPONENTS:
-        print(f"\n Creating component: {component['name']}")
+def _build_component(component):
+    """Create one component and return its progress log lines."""
+    log = [f"\n Creating component: {component['name']}"]
 
-        # Create directories
-        component_path = create_component_dirs(component['name'])
-        print(f"  ✓ Created directory structure")
+    # Create directories
+    component_path, dirs_created = create_component_dirs(component['name'])
+    log.append(_file_status("directory structure", dirs_created))
 
-        # Create files
-        create_cargo_toml(component_path, component)
-        print(f"  ✓ Created Cargo.toml")
+    # Create files
+    log.append(_file_status("Cargo.toml", create_cargo_toml(component_path, component)))
+    lib_written, types_written = create_lib_rs(component_path, component)
+    log.append(_file_status("src/lib.rs", lib_written))
+    log.append(_file_status("src/types.rs", types_written))
+    log.append(_file_status("README.md", create_readme(component_path, component)))
+    log.append(_file_status("component.yaml", create_component_yaml(component_path, component)))
+    log.append(_file_status("CLAUDE.md", create_claude_md(component_path, component)))
 
-        create_lib_rs(component_path, component)
-        print(f"  ✓ Created src/lib.rs")
+    return log
 
-        create_readme(component_path, component)
-        print(f"  ✓ Created README.md")
+def main():
+    """Create all components."""
+    print("Creating Font System components...")
 
-        try:
-            create_component_yaml(component_path, component)
-            print(f"  ✓ Created component.yaml")
-        except ImportError:
-            print(f"  ⚠ Skipped component.yaml (PyYAML not installed)")
+    # Warm the template cache here so worker threads never race to read it
+    _load_template()
 
-        create_claude_md(component_path, component)
-        print(f"  ✓ Created CLAUDE.md")
+    # Components are independent, so build them concurrently and print
+    # each one's log afterwards in definition order
+    with ThreadPoolExecutor(max_workers=min(len(COMPONENTS), os.cpu_count() or 1)) as executor:
+        for log in executor.map(_build_component, COMPONENTS):
+            print("\n".join(log))
 
     print("\n✅ All components created successfully!")
     print(f"\nCreated components:")